@@ -1,34 +1,66 @@
-from typing import Callable, Sequence
+from typing import Callable, Sequence, FrozenSet
+
+# Fixed bit per request method, the layout of `Route.method_mask`.
+# Bits 0-7 are the standard HTTP methods, bits 8-15 the common extension methods.
+# Other methods are kept on the Route but have no bit.
+_METHOD_BITS = {
+    "GET": 1 << 0,
+    "HEAD": 1 << 1,
+    "POST": 1 << 2,
+    "PUT": 1 << 3,
+    "DELETE": 1 << 4,
+    "PATCH": 1 << 5,
+    "OPTIONS": 1 << 6,
+    "TRACE": 1 << 7,
+    "CONNECT": 1 << 8,
+    "PROPFIND": 1 << 9,
+    "PROPPATCH": 1 << 10,
+    "MKCOL": 1 << 11,
+    "COPY": 1 << 12,
+    "MOVE": 1 << 13,
+    "LOCK": 1 << 14,
+    "UNLOCK": 1 << 15,
+}
+_METHOD_BIT_ITEMS = tuple(_METHOD_BITS.items())
+_NO_METHODS: FrozenSet[str] = frozenset()
 
 
 class Route:
 
-    __slots__ = "_name", "_pattern", "_handler", "_methods"
+    __slots__ = ("pattern", "name", "method_mask", "handler", "_other_methods")
 
     def __init__(self, name: str, pattern: str, handler: Callable, methods: Sequence[str]):
-        self._name = name
-        self._pattern = pattern
-        self._handler = handler
-        self._methods: tuple = tuple(set(i.upper() for i in methods))
-
-    @property
-    def name(self):
-        return self._name
-
-    @property
-    def pattern(self):
-        return self._pattern
-
-    @property
-    def handler(self):
-        return self._handler
+        self.name = name
+        self.pattern = pattern
+        self.handler = handler
+        method_mask = 0
+        other_methods = None
+        for i in methods:
+            method = i.upper()
+            bit = _METHOD_BITS.get(method)
+            if bit is not None:
+                method_mask |= bit
+            elif other_methods is None:
+                other_methods = {method}
+            else:
+                other_methods.add(method)
+        self.method_mask: int = method_mask
+        self._other_methods = frozenset(other_methods) if other_methods else _NO_METHODS
 
     @property
-    def methods(self):
-        return self._methods
+    def methods(self) -> FrozenSet[str]:
+        """ The request methods of the route, decoded from `method_mask`.
+        Note - A new frozenset is built on every access, use `method_mask` for
+        membership checks on a hot path (e.g. `route.method_mask & 1` for "GET").
+        """
+        method_mask = self.method_mask
+        methods = frozenset(method for method, bit in _METHOD_BIT_ITEMS if method_mask & bit)
+        return methods | self._other_methods if self._other_methods else methods
 
     def __repr__(self):
+        # Handlers such as `functools.partial` have no `__name__`
+        handler_name = getattr(self.handler, "__name__", repr(self.handler))
         return (
             f"Route(name='{self.name}', pattern='{self.pattern}', "
-            f"handler='{self.handler.__name__}' methods={self.methods})"
+            f"handler='{handler_name}' methods={self.methods})"
         )
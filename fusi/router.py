@@ -1,8 +1,10 @@
+import sys
 from typing import Optional, Dict, List, Union, Callable, Sequence
-from functools import lru_cache
 
 from .route import Route
 
+_MISSING = object()
+
 
 class RouterError(Exception):
     """ Raised when an illegal operation is encountered when configuring
@@ -45,9 +47,13 @@ class Router:
         self._name = name
         self._prefix = prefix
         self._routes: Dict[str, Route] = {}
+        self._static_patterns: Dict[str, Route] = {}
+        self._pattern_cache: Dict[str, Optional[Route]] = {}
+        self._cache_max = 1024
+        self._compiled: Optional[Callable[[str], Union[Route, None]]] = None
 
     def __contains__(self, item):
-        return item in self.routes
+        return item in self._routes.values()
 
     def __len__(self):
         return len(self._routes)
@@ -74,33 +80,68 @@ class Router:
         """ Match a route by name. Returns a Route object or None
         An optional `fallback` parameter can be used as a route name to fall back to.
         """
-        try:
-            return self._routes[name]
-        except KeyError:
-            if fallback:
-                return self.match_name(fallback)
-        return None
+        route = self._routes.get(name)
+        if route is None and fallback:
+            match_name = self.match_name
+            if getattr(match_name, "__func__", None) is not Router.match_name:
+                # Overridden, resolve the fallback through the override
+                return match_name(fallback)
+            route = self._routes.get(fallback)
+        return route
 
     def is_pattern_match(self, pattern: str, route: Route) -> bool:
         """ Basic pattern match. Override this method.
         This method is called from `match_pattern` and is used to perform the actual
         pattern match, returning either True if the pattern matches, otherwise False.
         It receives a pattern (the raw URL path) and a Route object.
+        Note - When not overridden, `match_pattern` skips this method and resolves
+        exact patterns directly.
         """
         return pattern == route.pattern
 
-    @lru_cache
     def match_pattern(self, pattern: str, fallback: Optional[str] = None) -> Union[Route, None]:
         """ Match a route by pattern. Returns a Route object or None.
         An optional `fallback` parameter can be used as a route name to fall back to.
-        Note - This method utilises the `lru_cache` decorator & `lru_cache` defaults.
+        Note - When `is_pattern_match` is overridden, results are cached per Router
+        (up to 1024 patterns) and the cache is cleared whenever a route is added.
         """
-        for route in self.routes:
-            if self.is_pattern_match(pattern, route):
-                return route
-        if fallback:
+        if getattr(self.is_pattern_match, "__func__", None) is Router.is_pattern_match:
+            route = self._static_patterns.get(pattern)
+        else:
+            cache = self._pattern_cache
+            route = cache.get(pattern, _MISSING)
+            if route is _MISSING:
+                route = (self._compiled or self.compile())(pattern)
+                if len(cache) >= self._cache_max:
+                    # Tolerates another thread evicting or clearing the cache concurrently
+                    cache.pop(next(iter(cache), None), None)
+                cache[pattern] = route
+        if route is None and fallback:
             return self.match_name(fallback)
-        return None
+        return route
+
+    def compile(self) -> Callable[[str], Union[Route, None]]:
+        """ Returns a matcher over a snapshot of the current routes, taking a pattern
+        and returning a Route object or None. Unlike `match_pattern`, the matcher
+        does not resolve fallbacks or use the pattern cache.
+        Note - Routes added after `compile` is called are not seen by the returned
+        matcher, call `compile` again to include them.
+        """
+        is_pattern_match = self.is_pattern_match
+        if getattr(is_pattern_match, "__func__", None) is Router.is_pattern_match:
+            return dict(self._static_patterns).get
+
+        routes = tuple(self._routes.values())
+
+        def matcher(pattern: str) -> Union[Route, None]:
+            for route in routes:
+                if is_pattern_match(pattern, route):
+                    return route
+            return None
+
+        # Used by `match_pattern` for its scan until the next call to `add_route`
+        self._compiled = matcher
+        return matcher
 
     def prepare_route_name(self, name: str) -> str:
         """ Called from `add_route`, this method is used to prepare the route
@@ -154,20 +195,21 @@ class Router:
             The Route object
         """
 
-        if not isinstance(name, str):
-            raise RouterError(f"parameter 'name' must be a string, not '{type(pattern)}'")
+        if type(name) is not str or type(pattern) is not str or not callable(handler):
+            # Slow path, str subclasses are accepted
+            if not isinstance(name, str):
+                raise RouterError(f"parameter 'name' must be a string, not '{type(name)}'")
 
-        if not isinstance(pattern, str):
-            raise RouterError(f"parameter 'pattern' must be a string, not '{type(pattern)}'")
+            if not isinstance(pattern, str):
+                raise RouterError(f"parameter 'pattern' must be a string, not '{type(pattern)}'")
 
-        if not callable(handler):
-            raise RouterError(f"parameter 'handler' must be callable, not '{type(handler)}'")
+            if not callable(handler):
+                raise RouterError(f"parameter 'handler' must be callable, not '{type(handler)}'")
 
-        route_name = self.prepare_route_name(name)
+        route_name = sys.intern(str(self.prepare_route_name(name)))
         if route_name in self._routes:
             raise RouterError(f"Route with name '{name}' already exists")
-
-        route_pattern = self.prepare_route_pattern(pattern)
+        route_pattern = sys.intern(str(self.prepare_route_pattern(pattern)))
 
         self.check_route_name(route_name)
         self.check_route_pattern(route_pattern)
@@ -176,5 +218,8 @@ class Router:
         route = Route(name=route_name, pattern=route_pattern, handler=route_handler, methods=methods)
 
         self._routes[route_name] = route
+        self._static_patterns.setdefault(route_pattern, route)
+        self._pattern_cache.clear()
+        self._compiled = None
 
         return route
@@ -5,7 +5,7 @@ def test_route_attrs():
     route = Route(name="test", pattern="/test", methods=["get"], handler=lambda: "Test")
     assert route.name == "test"
     assert route.pattern == "/test"
-    assert route.methods == ("GET", )
+    assert route.methods == frozenset({"GET"})
     assert route.handler() == "Test"
 
 
@@ -16,4 +16,22 @@ def test_route_repr():
 
     route = Route(name="test", pattern="/test", methods=["get"], handler=some_handler)
     r = repr(route)
-    assert r == "Route(name='test', pattern='/test', handler='some_handler' methods=('GET',))"
+    assert r == "Route(name='test', pattern='/test', handler='some_handler' methods=frozenset({'GET'}))"
+    route.name = "renamed"
+    assert repr(route).startswith("Route(name='renamed'")
+
+
+def test_route_method_mask():
+    route = Route(name="test", pattern="/test", methods=["get", "POST", "post", "propfind"], handler=lambda: "Test")
+    assert route.methods == frozenset({"GET", "POST", "PROPFIND"})
+    assert route.method_mask & 1
+    assert route.method_mask & 4
+    assert not route.method_mask & 2
+    assert route.method_mask == 1 | 4 | 1 << 9
+
+
+def test_route_unknown_methods_kept_without_bits():
+    route = Route(name="test", pattern="/test", methods=["get", "foo", "FOO", "bar"], handler=lambda: "Test")
+    assert route.methods == frozenset({"GET", "FOO", "BAR"})
+    assert route.method_mask == 1
+    assert Route(name="other", pattern="/other", methods=["unlock"], handler=lambda: "Test").method_mask == 1 << 15
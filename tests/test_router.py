@@ -1,6 +1,10 @@
+import functools
+import pickle
+import sys
+
 import pytest
 
-from fusi import Router, RouterError
+from fusi import Route, Router, RouterError
 
 
 def test_router_add_route():
@@ -125,6 +129,217 @@ def test_router_match_pattern_no_match_with_fallback():
     assert match is fallback
 
 
+def test_router_match_pattern_shared_prefixes():
+    router = Router()
+    patterns = ["/api/v1/users", "/api/v1/users/list", "/api/v1/uploads", "/api/v2/users", "/about"]
+    routes = {
+        pattern: router.add_route(name=pattern, pattern=pattern, handler=lambda: "Test", methods=["GET"])
+        for pattern in patterns
+    }
+    for pattern, route in routes.items():
+        assert router.match_pattern(pattern) is route
+    for pattern in ["/api", "/api/v1/user", "/api/v1/users/", "/about/us", "/", ""]:
+        assert router.match_pattern(pattern) is None
+
+
+def test_router_match_pattern_duplicate_pattern_first_wins():
+    router = Router()
+    first = router.add_route(name="first", pattern="/same", handler=lambda: "First", methods=["GET"])
+    router.add_route(name="second", pattern="/same", handler=lambda: "Second", methods=["GET"])
+    assert router.match_pattern("/same") is first
+
+
+def test_router_subclass_is_pattern_match():
+
+    class PrefixRouter(Router):
+        def is_pattern_match(self, pattern, route):
+            return pattern.startswith(route.pattern)
+
+    router = PrefixRouter()
+    route = router.add_route(name="static", pattern="/static", handler=lambda: "Static", methods=["GET"])
+    assert router.match_pattern("/static/css/main.css") is route
+    assert router.match_pattern("/other") is None
+
+
+def test_router_match_pattern_sees_routes_added_after_miss():
+    router = Router()
+    assert router.match_pattern("/late") is None
+    route = router.add_route(name="late", pattern="/late", handler=lambda: "Late", methods=["GET"])
+    assert router.match_pattern("/late") is route
+
+
+def test_router_subclass_pattern_cache():
+
+    class CountingRouter(Router):
+        calls = 0
+
+        def is_pattern_match(self, pattern, route):
+            CountingRouter.calls += 1
+            return pattern == route.pattern
+
+    router = CountingRouter()
+    route = router.add_route(name="test", pattern="/test", handler=lambda: "Test", methods=["GET"])
+    assert router.match_pattern("/test") is route
+    assert router.match_pattern("/test") is route
+    assert CountingRouter.calls == 1
+    # The cache holds 1024 patterns, filling it evicts the oldest entry "/test"
+    for i in range(1024):
+        assert router.match_pattern(f"/missing/{i}") is None
+    assert router.match_pattern("/test") is route
+    assert CountingRouter.calls == 1026
+    late = router.add_route(name="missing", pattern="/missing/0", handler=lambda: "Late", methods=["GET"])
+    assert router.match_pattern("/missing/0") is late
+
+
+def test_router_compile():
+    router = Router()
+    route = router.add_route(name="test", pattern="/test", handler=lambda: "Test", methods=["GET"])
+    matcher = router.compile()
+    assert matcher("/test") is route
+    assert matcher("/missing") is None
+    late = router.add_route(name="late", pattern="/late", handler=lambda: "Late", methods=["GET"])
+    assert matcher("/late") is None
+    assert router.compile()("/late") is late
+
+
+def test_router_subclass_compile_invalidated_by_add_route():
+
+    class PrefixRouter(Router):
+        def is_pattern_match(self, pattern, route):
+            return pattern.startswith(route.pattern)
+
+    router = PrefixRouter()
+    route = router.add_route(name="static", pattern="/static", handler=lambda: "Static", methods=["GET"])
+    matcher = router.compile()
+    assert matcher("/static/main.css") is route
+    assert matcher("/media/photo.jpg") is None
+    media = router.add_route(name="media", pattern="/media", handler=lambda: "Media", methods=["GET"])
+    assert matcher("/media/photo.jpg") is None
+    assert router.match_pattern("/media/photo.jpg") is media
+    assert router.compile()("/media/photo.jpg") is media
+
+
+def test_router_interns_names_and_patterns():
+    router = Router(name="api", prefix="/v1")
+    route = router.add_route(name="users", pattern="/users", handler=lambda: "Users", methods=["GET"])
+    assert route.name is sys.intern("api.users")
+    assert route.pattern is sys.intern("/v1/users")
+
+
+def test_router_subclass_prepare_hooks():
+
+    class LowerRouter(Router):
+        def prepare_route_name(self, name):
+            return super().prepare_route_name(name.lower())
+
+        def prepare_route_pattern(self, pattern):
+            return super().prepare_route_pattern(pattern.lower())
+
+    router = LowerRouter(name="api", prefix="/v1")
+    route = router.add_route(name="Users", pattern="/Users", handler=lambda: "Users", methods=["GET"])
+    assert route.name == "api.users"
+    assert route.pattern == "/v1/users"
+
+
+def test_router_subclass_check_and_handler_hooks():
+
+    class StrictRouter(Router):
+        def check_route_name(self, name):
+            if not name.isidentifier():
+                raise RouterError(f"Invalid route name '{name}'")
+            return True
+
+        def prepare_route_handler(self, handler):
+            return lambda: handler().upper()
+
+    router = StrictRouter()
+    route = router.add_route(name="ok", pattern="/ok", handler=lambda: "ok", methods=["GET"])
+    assert route.handler() == "OK"
+    with pytest.raises(RouterError):
+        router.add_route(name="not-ok", pattern="/not-ok", handler=lambda: "Fail", methods=["GET"])
+    assert router.match_pattern("/ok") is route
+
+
+def test_router_match_pattern_fallback_uses_match_name_override():
+    not_found = Route(name="not_found", pattern="/404", methods=["GET"], handler=lambda: "Page not found")
+
+    class DefaultRouter(Router):
+        def match_name(self, name, fallback=None):
+            return super().match_name(name, fallback) or not_found
+
+    router = DefaultRouter()
+    assert router.match_pattern("/x", fallback="home") is not_found
+
+
+def test_router_duplicate_name_rejected_before_hooks():
+
+    class WrappingRouter(Router):
+        wrapped = []
+
+        def prepare_route_handler(self, handler):
+            self.wrapped.append(handler)
+            return handler
+
+    router = WrappingRouter()
+    router.add_route(name="ok", pattern="/ok", methods=["get"], handler=lambda: "Test")
+    with pytest.raises(RouterError):
+        router.add_route(name="ok", pattern="/ok", methods=["get"], handler=lambda: "Test")
+    assert len(WrappingRouter.wrapped) == 1
+
+
+def test_router_pickle_round_trip():
+    router = Router(name="api", prefix="/v1")
+    route = router.add_route(name="users", pattern="/users", handler=str, methods=["GET"])
+    restored = pickle.loads(pickle.dumps(router))
+    assert repr(restored.match_pattern("/v1/users")) == repr(route)
+    other = restored.add_route(name="groups", pattern="/groups", handler=str, methods=["GET"])
+    assert other.name == "api.groups"
+    assert other.pattern == "/v1/groups"
+
+
+def test_router_subclass_name_and_prefix_properties():
+
+    class DynamicRouter(Router):
+        @property
+        def name(self):
+            return "dyn"
+
+        @property
+        def prefix(self):
+            return "/dyn"
+
+    router = DynamicRouter(name="orig", prefix="/orig")
+    route = router.add_route(name="q", pattern="/q", handler=str, methods=["GET"])
+    assert route.name == "dyn.q"
+    assert route.pattern == "/dyn/q"
+
+
+def test_router_match_name_fallback_uses_match_name_override():
+
+    class LowerRouter(Router):
+        def match_name(self, name, fallback=None):
+            return super().match_name(name.lower(), fallback)
+
+    router = LowerRouter()
+    not_found = router.add_route(name="notfound", pattern="/404", methods=["GET"], handler=lambda: "Not found")
+    assert router.match_name("x", "NotFound") is not_found
+    assert router.match_pattern("/x", "NotFound") is not_found
+
+
+def test_router_instance_assigned_hooks():
+    router = Router()
+    route = router.add_route(name="static", pattern="/s", handler=lambda: "Static", methods=["GET"])
+    router.is_pattern_match = lambda pattern, route: pattern.startswith(route.pattern)
+    assert router.match_pattern("/s/x") is route
+
+    def check_route_name(name):
+        raise RouterError(f"Invalid route name '{name}'")
+
+    router.check_route_name = check_route_name
+    with pytest.raises(RouterError):
+        router.add_route(name="other", pattern="/other", handler=lambda: "Other", methods=["GET"])
+
+
 def test_router_raises_router_error_with_bad_prefix():
     with pytest.raises(RouterError):
         router = Router(prefix="bad")
@@ -153,6 +368,34 @@ def test_router_raises_router_error_bad_name_type():
         router.add_route(name=1, pattern="/one", methods=["get"], handler=lambda: "Fail")
 
 
+def test_router_accepts_str_subclasses():
+
+    class Path(str):
+        pass
+
+    router = Router()
+    route = router.add_route(name=Path("ok"), pattern=Path("/ok"), methods=["get"], handler=lambda: "Ok")
+    assert router.match_pattern("/ok") is route
+    assert router.match_name("ok") is route
+
+
+def test_router_accepts_callables_without_name():
+
+    class Handler:
+        def __call__(self):
+            return "Instance"
+
+    router = Router()
+    partial_route = router.add_route(
+        name="partial", pattern="/partial", methods=["GET"], handler=functools.partial(str, "Partial")
+    )
+    instance_route = router.add_route(name="instance", pattern="/instance", methods=["GET"], handler=Handler())
+    assert partial_route.handler() == "Partial"
+    assert instance_route.handler() == "Instance"
+    assert "functools.partial" in repr(partial_route)
+    assert "Handler object" in repr(instance_route)
+
+
 def test_router_raises_router_error_bad_pattern_type():
     router = Router()
     with pytest.raises(RouterError):
@@ -173,9 +416,11 @@ def test_router_raises_router_error_pattern_no_slash():
 
 def test_router_raises_router_error_duplicate_name():
     router = Router()
-    router.add_route(name="ok", pattern="/ok", methods=["get"], handler=lambda: "Test")
+    route = router.add_route(name="ok", pattern="/ok", methods=["get"], handler=lambda: "Test")
     with pytest.raises(RouterError):
-        router.add_route(name="ok", pattern="/ok", methods=["get"], handler=lambda: "Test")
+        router.add_route(name="ok", pattern="/ok-again", methods=["get"], handler=lambda: "Test")
+    assert router.match_name("ok") is route
+    assert router.match_pattern("/ok-again") is None
 
 # TODO - Subclass Router and test methods
 